@@ -27,7 +27,15 @@ class QTreeView_Base(QTreeView):
             parent (QtWidgets.QWidget): The widget
         """
         QTreeView.__init__(self, parent)
-        QTimer.singleShot(200, self.style_me)
+        self.style_me()
+
+        # Coalesce a cascade of expanded signals, e.g. from expandAll(),
+        # into a single resize of the first column.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(
+            lambda: self.resizeColumnToContents(0))
         self.expanded.connect(self.resize_on_expand)
 
     def style_me(self):
@@ -47,13 +55,13 @@ class QTreeView_Base(QTreeView):
         # For TreeView: resizeColumnToContents
         # For TableView: resizeColumnsToContents
 
+        header = self.header()
         columns = self.model().columnCount(None)
         for i in range(columns):
             self.resizeColumnToContents(i)
-            width = self.columnWidth(i)
-            if width > max_width:
-                self.setColumnWidth(i, max_width)
+            if header.sectionSize(i) > max_width:
+                header.resizeSection(i, max_width)
 
     def resize_on_expand(self):
         """Resize when exposed."""
-        self.resizeColumnToContents(0)
+        self._resize_timer.start()
@@ -20,6 +20,8 @@ get the Ej, Ec or use input Ej, Ec to find the spectrum of the Cooper Pair Box.
 """
 # pylint: disable=invalid-name
 
+from functools import lru_cache
+
 import numpy as np
 import qutip as qt
 import scipy.linalg as linalg
@@ -94,8 +96,25 @@ class Hcpb:
         """Generate at initialization the number of levels and only recompute
         the size of the problem if nlevels changes."""
 
-        self._diag = np.arange(-self._nlevels, self._nlevels + 1)
-        self._off = np.ones(len(self._diag) - 1)
+        self._diag, self._off = self._charge_operators(self._nlevels)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _charge_operators(nlevels: int):
+        """Diagonal and offdiagonal components of the Hamiltonian, shared by
+        all instances with the same nlevels, so they are made read-only.
+
+        Args:
+            nlevels (int): Number of charge states of the CPB
+
+        Returns:
+            tuple[array, array]: Charge states and offdiagonal ones
+        """
+        diag = np.arange(-nlevels, nlevels + 1)
+        off = np.ones(len(diag) - 1)
+        diag.setflags(write=False)
+        off.setflags(write=False)
+        return diag, off
 
     def _calc_H(self):
         """Only diagonalize the Hamiltonian if the CPB is supplied with the
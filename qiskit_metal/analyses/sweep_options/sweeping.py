@@ -14,6 +14,7 @@
 """ Sweep a qcomponent option, and get results of analysis."""
 # pylint: disable=too-many-lines
 from typing import Tuple, Union
+import numpy as np
 import pandas as pd
 
 from qiskit_metal import Dict
@@ -24,7 +25,14 @@ from qiskit_metal.renderers.renderer_ansys.hfss_renderer import QHFSSRenderer
 
 class Sweeping():
     """The methods allow users to sweep a variable in a components's options.
-    Need access to renderers which are registered in QDesign."""
+    Need access to renderers which are registered in QDesign.
+
+    Sweep points are analyzed one after the other.  They share the single
+    Ansys session attached by connect_ansys(), and the design is rebuilt and
+    re-rendered for each point, so they cannot be farmed out to worker
+    processes.  To speed up a sweep, raise the number of cores in the HPC
+    and Analysis options of Ansys, which each solve then uses.
+    """
 
     def __init__(self, design: 'QDesign'):
         """Give QDesign to this class so Sweeping can access the registered
@@ -50,6 +58,39 @@ class Sweeping():
         value = a_dict[search]
         return value
 
+    @classmethod
+    def extrapolate_eigenfrequency(
+            cls, values: list, freqs: list,
+            next_value: float) -> Union[float, np.ndarray]:
+        """Newton-style extrapolation of eigenfrequencies to the next sweep
+        value, from the last two (linear) or three (quadratic) sweep points.
+        All modes are extrapolated at once when each entry of freqs is an
+        array of eigenfrequencies.
+
+        Args:
+            values (list): Numeric values of the swept option, in sweep order.
+            freqs (list): Eigenfrequency, or array of eigenfrequencies, found
+                            at each of the values.
+            next_value (float): Value of the swept option to extrapolate to.
+
+        Returns:
+            Union[float, np.ndarray]: Guess of the eigenfrequencies at
+            next_value.  Repeated sweep values fall back to the last
+            eigenfrequencies.
+        """
+        x = values[-3:]
+        f = [np.asarray(freq, dtype=float) for freq in freqs[-3:]]
+        guess = f[-1]
+        if len(x) >= 2 and x[-1] != x[-2]:
+            slope = (f[-1] - f[-2]) / (x[-1] - x[-2])
+            guess = guess + slope * (next_value - x[-1])
+            if len(x) == 3 and x[-2] != x[-3] and x[-1] != x[-3]:
+                prev_slope = (f[-2] - f[-3]) / (x[-2] - x[-3])
+                curvature = (slope - prev_slope) / (x[-1] - x[-3])
+                spread = (next_value - x[-1]) * (next_value - x[-2])
+                guess = guess + curvature * spread
+        return guess
+
     def error_check_sweep_input(self, qcomp_name: str, option_name: str,
                                 option_sweep: list) -> Tuple[list, Dict, int]:
         """ Implement error checking of data for sweeping.
@@ -218,7 +259,7 @@ class Sweeping():
               passes.  Defaults to 1.
             * pct_refinement (int, optional): Percent refinement.
               Defaults to 30.
-            * basis_order (int, optional): Basis order. Defaults to -1.
+            * basis_order (int, optional): Basis order. Defaults to 2.
 
         Returns:
             int: The return code of status.
@@ -445,7 +486,8 @@ class Sweeping():
             box_plus_buffer_render: bool = True,
             setup_args: Dict = None,
             leave_last_design: bool = True,
-            design_name: str = "Sweep_Eigenmode") -> Tuple[Dict, int]:
+            design_name: str = "Sweep_Eigenmode",
+            reuse_previous: bool = False) -> Tuple[Dict, int]:
         """
         Ansys must be open with inserted project. A design, "HFSS Design"
         with eigenmode solution-type will be inserted by this method.
@@ -479,6 +521,14 @@ class Sweeping():
                                     Default is True.
             design_name (str, optional):  Name of HFSS_design to use in
                                     project. Defaults to "Sweep_Eigenmode".
+            reuse_previous (bool, optional): Use the eigenfrequencies of the
+                                    previous sweep points to raise the
+                                    minimum frequency of the setup, just
+                                    below the extrapolated lowest mode.
+                                    Only used for numeric option_sweep,
+                                    best sorted, since modes below the
+                                    raised minimum are not found.
+                                    Defaults to False.
 
         Returns:
             Tuple[Dict, int]: The dict key is each value of option_sweep, the
@@ -520,6 +570,16 @@ class Sweeping():
 
         len_sweep = len(option_sweep) - 1
 
+        # Eigenfrequencies (GHz) found for each numeric sweep value.
+        min_freq_ghz = setup_args.get('min_freq_ghz') or int(
+            a_hfss.parse_value(
+                a_hfss.hfss_options.eigenmode_setup.min_freq_ghz))
+        prev_values = []
+        prev_freqs_ghz = []
+        # First order basis often fails to converge for EPR, escalate once.
+        basis_order = setup_args.get('basis_order') or int(
+            a_hfss.parse_value(a_hfss.hfss_options.eigenmode_setup.basis_order))
+
         for index, item in enumerate(option_sweep):
             if option_path[-1] in a_value.keys():
                 a_value[option_path[-1]] = item
@@ -536,14 +596,49 @@ class Sweeping():
                                  box_plus_buffer=box_plus_buffer_render
                                 )  #Render the items chosen
 
+            item_value = self.design.parse_value(item)
+            if reuse_previous and not isinstance(item_value, (int, float)):
+                reuse_previous = False
+                # Undo any min_freq raised from earlier sweep values.
+                a_hfss.edit_eigenmode_setup(
+                    Dict(name=a_hfss.pinfo.setup_name,
+                         min_freq_ghz=min_freq_ghz))
+            if reuse_previous and len(prev_values) >= 2:
+                # Modes may cross, so extrapolate them all and keep the lowest.
+                guess_ghz = np.min(
+                    self.extrapolate_eigenfrequency(prev_values, prev_freqs_ghz,
+                                                    item_value))
+                # Stay well below the guess, HFSS finds modes above min_freq.
+                a_hfss.edit_eigenmode_setup(
+                    Dict(name=a_hfss.pinfo.setup_name,
+                         min_freq_ghz=max(min_freq_ghz, int(0.8 * guess_ghz))))
+
             a_hfss.analyze_setup(
                 a_hfss.pinfo.setup.name)  #Analyze said solution setup.
+            df_t, df_f, _, convergence = self.hfss_em_get_convergence(a_hfss)
+
+            if not convergence and basis_order == 1:
+                self.design.logger.warning(
+                    f'{option_name}={item} did not converge with first order '
+                    'basis. Analyzing again, and for the rest of the sweep, '
+                    'with second order basis.')
+                basis_order = 2
+                a_hfss.edit_eigenmode_setup(
+                    Dict(name=a_hfss.pinfo.setup_name, basis_order=basis_order))
+                a_hfss.analyze_setup(a_hfss.pinfo.setup.name)
+                df_t, df_f, _, convergence = self.hfss_em_get_convergence(
+                    a_hfss)
+
             setup = a_hfss.pinfo.setup
             #solution_name = setup.solution_name
             all_solutions = setup.get_solutions()
             #setup_names = all_solutions.list_variations()
             freqs, kappa_over_2pis = all_solutions.eigenmodes()
-            df_t, df_f, _, convergence = self.hfss_em_get_convergence(a_hfss)
+
+            if reuse_previous and convergence and len(freqs):
+                prev_values.append(item_value)
+                # pyEPR already reports the eigenmodes in GHz.
+                prev_freqs_ghz.append(np.array(freqs, dtype=float))
 
             if not convergence:
                 self.design.logger.warning(
@@ -560,6 +655,7 @@ class Sweeping():
 
             sweep_values['convergence_eig_f'] = df_f
             sweep_values['convergence_t'] = df_t
+            sweep_values['basis_order'] = basis_order
             all_sweep[item] = sweep_values
 
             #Decide if need to clean the design.
@@ -576,7 +672,8 @@ class Sweeping():
     def hfss_em_get_convergence(
         self,
         a_hfss: 'QHFSSRenderer',
-        variation: str = None
+        variation: str = None,
+        use_cache: bool = False
     ) -> Tuple[pd.core.frame.DataFrame, pd.core.frame.DataFrame, str, bool]:
         """Use QHFSSRenderer to get convergence data from Ansys for eigenmode.
 
@@ -585,6 +682,8 @@ class Sweeping():
             variation (str, optional): Information from pyEPR; variation should
                         be in the form variation = "scale_factor='1.2001'".
                         Defaults to None.
+            use_cache (bool, optional): Passed to
+                        QHFSSRenderer.get_convergences(). Defaults to False.
 
         Returns:
             Tuple[pd.core.frame.DataFrame, pd.core.frame.DataFramestr, str, str]:
@@ -594,7 +693,7 @@ class Sweeping():
             4th bool: If data converged.
         """
         convergence_t, convergence_f, gui_text = a_hfss.get_convergences(
-            variation)
+            variation, use_cache=use_cache)
 
         text_list, convergence = self.parse_text_from_hfss_convergence(gui_text)
 
@@ -633,7 +732,9 @@ class Sweeping():
     def hfss_dm_get_convergence(
             self,
             a_hfss: 'QHFSSRenderer',
-            variation: str = None) -> Tuple[pd.core.frame.DataFrame, str, bool]:
+            variation: str = None,
+            use_cache: bool = False
+    ) -> Tuple[pd.core.frame.DataFrame, str, bool]:
         """Use QHFSSRenderer to get convergence data from Ansys for drivenmodal.
 
         Args:
@@ -641,6 +742,9 @@ class Sweeping():
             variation (str, optional): Information from pyEPR; variation should
                             be in the form variation = "scale_factor='1.2001'".
                             Defaults to None.
+            use_cache (bool, optional): Passed to
+                            QHFSSRenderer.get_convergences().
+                            Defaults to False.
 
         Returns:
             Tuple[pd.core.frame.DataFrame, str, bool]:
@@ -649,7 +753,8 @@ class Sweeping():
             3rd bool: If data converged.
         """
 
-        convergence_t, _, gui_text = a_hfss.get_convergences(variation)
+        convergence_t, _, gui_text = a_hfss.get_convergences(
+            variation, use_cache=use_cache)
         text_list, convergence = self.parse_text_from_hfss_convergence(gui_text)
         return convergence_t, text_list, convergence
 
@@ -13,6 +13,7 @@
 # that they have been altered from the originals.
 
 from collections import defaultdict
+from copy import deepcopy
 from pathlib import Path
 from typing import Union, Tuple
 
@@ -68,7 +69,7 @@ class QHFSSRenderer(QAnsysRenderer):
                              min_passes='1',
                              min_converged='1',
                              pct_refinement='30',
-                             basis_order='-1'),
+                             basis_order='2'),
         port_inductor_gap=
         '10um'  # spacing between port and inductor if junction is drawn both ways
     )
@@ -93,6 +94,10 @@ class QHFSSRenderer(QAnsysRenderer):
                          render_template=render_template,
                          render_options=render_options)
 
+        # Edits to the setups of one renderer must not leak into the class
+        # defaults shared with every other QHFSSRenderer.
+        self.hfss_options = deepcopy(QHFSSRenderer.hfss_options)
+
         self.chip_subtract_dict = defaultdict(set)
         self.assign_perfE = []
         self.assign_mesh = []
@@ -101,6 +106,13 @@ class QHFSSRenderer(QAnsysRenderer):
 
         self.current_sweep = None
 
+        # Convergence data keyed by
+        # (project_name, design_name, setup_name, variation).
+        self._conv_cache = {}
+
+        # Fingerprint of the inputs of the last render_design().
+        self._last_render_key = None
+
         QHFSSRenderer.load()
 
     def render_design(self,
@@ -156,6 +168,11 @@ class QHFSSRenderer(QAnsysRenderer):
         junctions are specified in the form (component_name, element_name)
         in the list ignored_jjs.
 
+        If neither the arguments nor the geometry, chips, variables and
+        options changed since the previous call, and the Ansys design still
+        holds the rendered objects, nothing is re-rendered.  Call
+        clean_active_design() first to force a full render.
+
         The final parameter, box_plus_buffer, determines how the chip is drawn.
         When set to True, it takes the minimum rectangular bounding box of all
         rendered components and adds a buffer of x_buffer_width_mm and
@@ -193,11 +210,22 @@ class QHFSSRenderer(QAnsysRenderer):
                 'Unable to proceed with rendering. Please check selection.')
             return
 
+        render_key = self._render_key(open_pins, port_list, jj_to_port,
+                                      ignored_jjs, box_plus_buffer)
+        if (render_key == self._last_render_key and self.pinfo and
+                self.pinfo.get_all_object_names()):
+            self.logger.debug(
+                'Geometry and render arguments unchanged since the last '
+                'render_design(), Ansys design was not re-rendered.')
+            return
+        self._last_render_key = None
+
         self.chip_subtract_dict = defaultdict(set)
         self.assign_perfE = []
         self.assign_mesh = []
         self.jj_lumped_ports = {}
         self.jj_to_ignore = set()
+        self.clear_convergence_cache()
 
         if jj_to_port:
             self.jj_lumped_ports = {
@@ -221,6 +249,32 @@ class QHFSSRenderer(QAnsysRenderer):
         self.metallize()
         if port_list:
             self.create_ports(port_list)
+        self._last_render_key = render_key
+
+    def _render_key(self,
+                    open_pins: Union[list, None] = None,
+                    port_list: Union[list, None] = None,
+                    jj_to_port: Union[list, None] = None,
+                    ignored_jjs: Union[list, None] = None,
+                    box_plus_buffer: bool = True) -> int:
+        """Fingerprint everything render_design() draws from: the Ansys
+        design, the arguments, the qgeometry tables, chips, variables and
+        renderer options.
+
+        Returns:
+            int: Equal keys mean the rendered Ansys design would be the same.
+        """
+        pinfo = self.pinfo
+        tables = tuple((name, table.shape,
+                        pd.util.hash_pandas_object(table).values.tobytes())
+                       for name, table in self.design.qgeometry.tables.items())
+        return hash(
+            (pinfo.project_name if pinfo else None,
+             pinfo.design_name if pinfo else None, tuple(self.qcomp_ids),
+             self.case, str(open_pins), str(port_list), str(jj_to_port),
+             str(ignored_jjs), box_plus_buffer, tables, str(self.design.chips),
+             str(self.design.variables), str(self.options),
+             str(self.hfss_options)))
 
     def create_ports(self, port_list: list):
         """Add ports and their respective impedances in Ohms to designated pins
@@ -703,7 +757,7 @@ class QHFSSRenderer(QAnsysRenderer):
             min_passes (int, optional): Minimum number of passes. Defaults to 1.
             min_converged (int, optional): Minimum number of converged passes. Defaults to 1.
             pct_refinement (int, optional): Percent refinement. Defaults to 30.
-            basis_order (int, optional): Basis order. Defaults to -1.
+            basis_order (int, optional): Basis order. Defaults to 2.
         """
         esu = self.hfss_options.eigenmode_setup
 
@@ -752,7 +806,7 @@ class QHFSSRenderer(QAnsysRenderer):
             * max_delta_f (float, optional): Maximum difference in freq between consecutive passes. Defaults to 0.5.
             * max_passes (int, optional): Maximum number of passes. Defaults to 10.
             * pct_refinement (int, optional): Percent refinement. Defaults to 30.
-            * basis_order (int, optional): Basis order. Defaults to -1.
+            * basis_order (int, optional): Basis order. Defaults to 2.
 
             Note, that these two are currently NOT implemented:
             Ansys API named EditSetup not documented for HFSS, and
@@ -1005,6 +1059,7 @@ class QHFSSRenderer(QAnsysRenderer):
             setup_name (str): Name of setup.
         """
         if self.pinfo:
+            self.clear_convergence_cache(setup_name)
             setup = self.pinfo.get_setup(setup_name)
             setup.analyze()
 
@@ -1053,6 +1108,7 @@ class QHFSSRenderer(QAnsysRenderer):
             setup_name (str): Name of setup to analyze.
         """
         if self.pinfo:
+            self.clear_convergence_cache(setup_name)
             setup = self.pinfo.get_setup(setup_name)
             sweep = setup.get_sweep(sweep_name)
             sweep.analyze_sweep()
@@ -1133,12 +1189,21 @@ class QHFSSRenderer(QAnsysRenderer):
         if self.pinfo:
             return epr.DistributedAnalysis(self.pinfo)
 
-    def get_convergences(self, variation: str = None):
+    def get_convergences(self, variation: str = None, use_cache: bool = False):
         """Get convergence for convergence_t, convergence_f, and text from GUI for solution data.
 
+        Each result read from Ansys is cached.  The cache is cleared for a setup
+        when it is analyzed with analyze_setup() or analyze_sweep(), and entirely
+        when the design is re-rendered or Ansys is connected or disconnected.
+        Analyses run outside this renderer, e.g. with pinfo.setup.analyze(), are
+        not detected, so only set use_cache when every analysis goes through the
+        renderer.
+
         Args:
             variation (str, optional):  Information from pyEPR; variation should be in the form
             variation = "scale_factor='1.2001'". Defaults to None.
+            use_cache (bool, optional): Return the cached result, if any, instead of
+            reading it from Ansys. Defaults to False.
 
         Returns:
             tuple[pandas.core.frame.DataFrame, pandas.core.frame.DataFrame, str]:
@@ -1149,23 +1214,66 @@ class QHFSSRenderer(QAnsysRenderer):
         if self.pinfo:
             design = self.pinfo.design
             setup = self.pinfo.setup
-            convergence_t, text = setup.get_convergence(variation)
-            convergence_f = hfss_report_f_convergence(
-                design, setup, self.logger, [])  # TODO; Fix variation []
-            return convergence_t, convergence_f, text
+            key = (self.pinfo.project_name, self.pinfo.design_name, setup.name,
+                   variation)
+            if not use_cache or key not in self._conv_cache:
+                convergence_t, text = setup.get_convergence(variation)
+                convergence_f = hfss_report_f_convergence(
+                    design, setup, self.logger, [])  # TODO; Fix variation []
+                self._conv_cache[key] = (convergence_t, convergence_f, text)
+            return self._conv_cache[key]
+
+    def clear_convergence_cache(self, setup_name: str = None):
+        """Forget convergence data cached by get_convergences().
+
+        Args:
+            setup_name (str, optional): Only forget the data of this setup.
+                Defaults to None, which forgets everything.
+        """
+        if setup_name is None:
+            self._conv_cache.clear()
+            return
+        for key in [key for key in self._conv_cache if key[2] == setup_name]:
+            del self._conv_cache[key]
+
+    def connect_ansys(self,
+                      project_path: str = None,
+                      project_name: str = None,
+                      design_name: str = None):
+        """Connect to Ansys, see QAnsysRenderer.connect_ansys().  Forget the
+        cached convergence data of any previous connection.
+
+        Args:
+            project_path (str, optional): Path without file name
+            project_name (str, optional): File name (with or without extension)
+            design_name (str, optional): Name of the default design to open from the project file
+        """
+        self.clear_convergence_cache()
+        super().connect_ansys(project_path=project_path,
+                              project_name=project_name,
+                              design_name=design_name)
+
+    def disconnect_ansys(self):
+        """Disconnect Ansys and forget the cached convergence data."""
+        self.clear_convergence_cache()
+        super().disconnect_ansys()
 
     def plot_convergences(self,
                           variation: str = None,
-                          fig: mpl.figure.Figure = None):
+                          fig: mpl.figure.Figure = None,
+                          use_cache: bool = False):
         """Plot the convergences in Ansys window.
 
         Args:
             variation (str, optional): Information from pyEPR; variation should be in the form
             variation = "scale_factor='1.2001'". Defaults to None.
             fig (matplotlib.figure.Figure, optional): A mpl figure. Defaults to None.
+            use_cache (bool, optional): Re-plot the data cached by get_convergences(),
+            see its caveats. Defaults to False.
         """
         if self.pinfo:
-            convergence_t, convergence_f, _ = self.get_convergences(variation)
+            convergence_t, convergence_f, _ = self.get_convergences(
+                variation, use_cache=use_cache)
             hfss_plot_convergences_report(convergence_t,
                                           convergence_f,
                                           fig=fig,
@@ -1188,18 +1296,20 @@ def hfss_plot_convergences_report(convergence_t: pd.core.frame.DataFrame,
     """
 
     if fig is None:
-        fig = plt.figure(figsize=(11, 3.))
+        fig, axs = plt.subplots(1,
+                                3,
+                                figsize=(11, 3.),
+                                gridspec_kw=dict(width_ratios=[1.2, 1.5, 1]))
 
-        # Grid spec and axes;    height_ratios=[4, 1], wspace=0.5
-        gs = mpl.gridspec.GridSpec(1, 3, width_ratios=[1.2, 1.5, 1])
-        axs = [fig.add_subplot(gs[i]) for i in range(3)]
+        # The pyEPR plotters need Series, so slice each column only once.
+        solved_elements = convergence_t.iloc[:, 0]
+        max_delta_f = convergence_t.iloc[:, 1]
 
         ax0t = axs[1].twinx()
         plot_convergence_f_vspass(axs[0], convergence_f)
-        plot_convergence_max_df(axs[1], convergence_t.iloc[:, 1])
-        plot_convergence_solved_elem(ax0t, convergence_t.iloc[:, 0])
-        plot_convergence_maxdf_vs_sol(axs[2], convergence_t.iloc[:, 1],
-                                      convergence_t.iloc[:, 0])
+        plot_convergence_max_df(axs[1], max_delta_f)
+        plot_convergence_solved_elem(ax0t, solved_elements)
+        plot_convergence_maxdf_vs_sol(axs[2], max_delta_f, solved_elements)
 
         fig.tight_layout(w_pad=0.1)  # pad=0.0, w_pad=0.1, h_pad=1.0)
 
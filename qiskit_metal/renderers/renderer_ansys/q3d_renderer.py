@@ -13,6 +13,7 @@
 # that they have been altered from the originals.
 """QQ3DRenderer."""
 
+from copy import deepcopy
 from typing import List, Union
 
 import pandas as pd
@@ -87,6 +88,11 @@ class QQ3DRenderer(QAnsysRenderer):
                          initiate=initiate,
                          render_template=render_template,
                          render_options=render_options)
+
+        # Edits to the setups of one renderer must not leak into the class
+        # defaults shared with every other QQ3DRenderer.
+        self.q3d_options = deepcopy(QQ3DRenderer.q3d_options)
+
         QQ3DRenderer.load()
 
     @property
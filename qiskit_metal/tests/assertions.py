@@ -17,6 +17,7 @@
 # pylint: disable-msg=bad-continuation
 """Custom assertion for unit tests."""
 
+from contextlib import contextmanager
 from itertools import zip_longest
 from typing import Iterable, Optional
 
@@ -24,6 +25,24 @@ from typing import Iterable, Optional
 class AssertionsMixin:
     """Custom assertions for unit tests."""
 
+    @contextmanager
+    def assertNoException(self, msg: str):
+        """Assert the body of the with block raises no exception.
+
+        The original exception is chained to the failure, so its traceback
+        is still reported.
+
+        Args:
+            msg (str): Message to show on failure, e.g. the call that failed.
+
+        Return:
+            Exception: Failure exception, or nothing
+        """
+        try:
+            yield
+        except Exception as err:  # pylint: disable=broad-except
+            raise self.failureException(f"{msg}: {err}") from err
+
     def assertAlmostEqualRel(
         self,
         expected: float,
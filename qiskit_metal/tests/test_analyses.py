@@ -20,6 +20,7 @@
 
 from pathlib import Path
 import unittest
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
@@ -29,8 +30,9 @@ from qiskit_metal.analyses.hamiltonian.transmon_charge_basis import Hcpb
 from qiskit_metal.analyses.hamiltonian.HO_wavefunctions import wavefunction
 from qiskit_metal.analyses.em import cpw_calculations, kappa_calculation
 from qiskit_metal.analyses.sweep_options.sweeping import Sweeping
+from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
 from qiskit_metal.tests.assertions import AssertionsMixin
-from qiskit_metal import designs
+from qiskit_metal import designs, Dict
 
 TEST_DATA = Path(__file__).parent / "test_data"
 
@@ -38,6 +40,11 @@ TEST_DATA = Path(__file__).parent / "test_data"
 class TestAnalyses(unittest.TestCase, AssertionsMixin):
     """Unit test class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the design shared by the tests, none of which modify it."""
+        cls.design = designs.DesignPlanar()
+
     def setUp(self):
         """Setup unit test."""
         pass
@@ -48,38 +55,17 @@ class TestAnalyses(unittest.TestCase, AssertionsMixin):
 
     def test_analyses_instantiate_hcpb(self):
         """Test instantiation of Hcpb in analytic_transmon.py."""
-        try:
-            Hcpb()
-        except Exception:
-            self.fail("Hcpb() failed")
-
-        try:
-            Hcpb(nlevels=15)
-        except Exception:
-            self.fail("Hcpb(nlevels=15) failed")
-
-        try:
-            Hcpb(nlevels=15, Ej=13971.3)
-        except Exception:
-            self.fail("Hcpb(nlevels=15, Ej=13971.3) failed")
-
-        try:
-            Hcpb(nlevels=15, Ej=13971.3, Ec=295.2)
-        except Exception:
-            self.fail("Hcpb(nlevels=15, Ej=13971.3, Ec=295.2) failed")
-
-        try:
-            Hcpb(nlevels=15, Ej=13971.3, Ec=295.2, ng=0.001)
-        except Exception:
-            self.fail("Hcpb(nlevels=15, Ej=13971.3, Ec=295.2, ng=0.001) failed")
+        for kwargs in (dict(), dict(nlevels=15), dict(nlevels=15, Ej=13971.3),
+                       dict(nlevels=15, Ej=13971.3, Ec=295.2),
+                       dict(nlevels=15, Ej=13971.3, Ec=295.2, ng=0.001)):
+            with self.subTest(**kwargs):
+                with self.assertNoException(f"Hcpb(**{kwargs}) failed"):
+                    Hcpb(**kwargs)
 
     def test_analyses_instantiate_sweeping(self):
         """Test instantiation of Sweeping in analytic_transmon.py."""
-        try:
-            design = designs.DesignPlanar()
-            Sweeping(design)
-        except Exception:
-            self.fail("Sweeping failed")
+        with self.assertNoException("Sweeping failed"):
+            Sweeping(self.design)
 
     def test_analyses_cpw_guided_wavelength(self):
         """Test the functionality of guided_wavelength in
@@ -808,13 +794,60 @@ class TestAnalyses(unittest.TestCase, AssertionsMixin):
 
     def test_analysis_sweeping_option_value(self):
         """Test the option_value function in the Sweeping class"""
-        design = designs.DesignPlanar()
-        sweeping = Sweeping(design)
+        sweeping = Sweeping(self.design)
 
         in_dict = {'a': 1, 'b': 'bee'}
         self.assertEqual(sweeping.option_value(in_dict, 'a'), 1)
         self.assertEqual(sweeping.option_value(in_dict, 'b'), 'bee')
 
+    def test_analysis_sweeping_extrapolate_eigenfrequency(self):
+        """Test the extrapolate_eigenfrequency function in the Sweeping
+        class."""
+        self.assertAlmostEqual(
+            Sweeping.extrapolate_eigenfrequency([1, 2], [2, 4], 3), 6)
+        self.assertAlmostEqual(
+            Sweeping.extrapolate_eigenfrequency([0, 1, 2, 3], [0, 1, 4, 9], 4),
+            16)
+        self.assertAlmostEqual(
+            Sweeping.extrapolate_eigenfrequency([1, 1], [5, 6], 2), 6)
+        freqs = [np.array([1, 5]), np.array([4, 6]), np.array([9, 7])]
+        guess = Sweeping.extrapolate_eigenfrequency([1, 2, 3], freqs, 4)
+        self.assertIterableAlmostEqual([16, 8], guess)
+
+    def test_analysis_sweeping_eigenmode_reuse_previous(self):
+        """Test the eigenfrequencies of previous sweep points raise min_freq
+        in sweep_one_option_get_eigenmode_solution_data."""
+        # Own design, since the sweep edits the component options.
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        a_hfss = MagicMock()
+        design.renderers.hfss = a_hfss
+        sweeping = Sweeping(design)
+        eigenmodes = a_hfss.pinfo.setup.get_solutions.return_value.eigenmodes
+        # Linear in pad_gap, in GHz as pyEPR reports them.
+        freqs_ghz = ([5.0, 9.0], [6.0, 10.0], [7.0, 11.0])
+
+        for reuse_previous, expected in ((False, []), (True, [5])):
+            with self.subTest(reuse_previous=reuse_previous):
+                a_hfss.edit_eigenmode_setup.reset_mock()
+                eigenmodes.side_effect = [(freqs, None) for freqs in freqs_ghz]
+                with patch.object(sweeping,
+                                  'hfss_em_get_convergence',
+                                  return_value=(None, None, [], True)):
+                    _, return_code = (
+                        sweeping.sweep_one_option_get_eigenmode_solution_data(
+                            'Q1',
+                            'pad_gap', ['1mm', '2mm', '3mm'], ['Q1'], [], [],
+                            setup_args=Dict(min_freq_ghz=1, basis_order=2),
+                            reuse_previous=reuse_previous))
+                self.assertEqual(return_code, 0)
+                # The third point is seeded from 0.8 * 7 GHz.
+                min_freqs = [
+                    args[0].min_freq_ghz
+                    for args, _ in a_hfss.edit_eigenmode_setup.call_args_list
+                ]
+                self.assertEqual(min_freqs, expected)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -20,6 +20,7 @@
 """Qiskit Metal unit tests analyses functionality."""
 
 import unittest
+from unittest.mock import MagicMock, patch
 import matplotlib.pyplot as _plt
 
 from qiskit_metal import designs
@@ -33,6 +34,7 @@ from qiskit_metal.renderers.renderer_gds.gds_renderer import QGDSRenderer
 from qiskit_metal.renderers.renderer_mpl.mpl_interaction import MplInteraction
 
 from qiskit_metal.renderers.renderer_ansys import ansys_renderer
+from qiskit_metal.renderers.renderer_ansys import hfss_renderer
 
 from qiskit_metal.qgeometries.qgeometries_handler import QGeometryTables
 from qiskit_metal.qlibrary.qubits.transmon_pocket import TransmonPocket
@@ -202,31 +204,34 @@ class TestRenderers(unittest.TestCase):
         options = renderer.q3d_options
 
         self.assertEqual(renderer.name, 'q3d')
-
-        self.assertEqual(len(options), 4)
-        self.assertEqual(len(options['add_setup']), 12)
-        self.assertEqual(len(options['get_capacitance_matrix']), 3)
-        self.assertEqual(options['material_type'], 'pec')
-        self.assertEqual(options['material_thickness'], '200nm')
-
-        self.assertEqual(options['add_setup']['freq_ghz'], '5.0')
-        self.assertEqual(options['add_setup']['name'], 'Setup')
-        self.assertEqual(options['add_setup']['save_fields'], 'False')
-        self.assertEqual(options['add_setup']['enabled'], 'True')
-        self.assertEqual(options['add_setup']['max_passes'], '15')
-        self.assertEqual(options['add_setup']['min_passes'], '2')
-        self.assertEqual(options['add_setup']['min_converged_passes'], '2')
-        self.assertEqual(options['add_setup']['percent_error'], '0.5')
-        self.assertEqual(options['add_setup']['percent_refinement'], '30')
-        self.assertEqual(options['add_setup']['auto_increase_solution_order'],
-                         'True')
-        self.assertEqual(options['add_setup']['solution_order'], 'High')
-        self.assertEqual(options['add_setup']['solver_type'], 'Iterative')
-
-        self.assertEqual(options['get_capacitance_matrix']['variation'], '')
-        self.assertEqual(options['get_capacitance_matrix']['solution_kind'],
-                         'AdaptivePass')
-        self.assertEqual(options['get_capacitance_matrix']['pass_number'], '3')
+        self.assertDictEqual(
+            options, {
+                'material_type': 'pec',
+                'material_thickness': '200nm',
+                'add_setup': {
+                    'freq_ghz': '5.0',
+                    'name': 'Setup',
+                    'save_fields': 'False',
+                    'enabled': 'True',
+                    'max_passes': '15',
+                    'min_passes': '2',
+                    'min_converged_passes': '2',
+                    'percent_error': '0.5',
+                    'percent_refinement': '30',
+                    'auto_increase_solution_order': 'True',
+                    'solution_order': 'High',
+                    'solver_type': 'Iterative'
+                },
+                'get_capacitance_matrix': {
+                    'variation': '',
+                    'solution_kind': 'AdaptivePass',
+                    'pass_number': '3'
+                }
+            })
+
+        options['add_setup']['max_passes'] = '20'
+        self.assertEqual(QQ3DRenderer.q3d_options['add_setup']['max_passes'],
+                         '15')
 
     def test_renderer_hfss_render_options(self):
         """Test that defaults in QHFSSRender were not accidentally changed."""
@@ -235,29 +240,35 @@ class TestRenderers(unittest.TestCase):
         options = renderer.hfss_options
 
         self.assertEqual(renderer.name, 'hfss')
-        self.assertEqual(len(options), 3)
-        self.assertEqual(len(options['drivenmodal_setup']), 8)
-        self.assertEqual(len(options['eigenmode_setup']), 9)
-        self.assertEqual(options['port_inductor_gap'], '10um')
-
-        self.assertEqual(options['drivenmodal_setup']['freq_ghz'], '5')
-        self.assertEqual(options['drivenmodal_setup']['name'], "Setup")
-        self.assertEqual(options['drivenmodal_setup']['max_delta_s'], '0.1')
-        self.assertEqual(options['drivenmodal_setup']['max_passes'], '10')
-        self.assertEqual(options['drivenmodal_setup']['min_passes'], '1')
-        self.assertEqual(options['drivenmodal_setup']['min_converged'], '1')
-        self.assertEqual(options['drivenmodal_setup']['pct_refinement'], '30')
-        self.assertEqual(options['drivenmodal_setup']['basis_order'], '1')
-
-        self.assertEqual(options['eigenmode_setup']['name'], "Setup")
-        self.assertEqual(options['eigenmode_setup']['min_freq_ghz'], '1')
-        self.assertEqual(options['eigenmode_setup']['n_modes'], '1')
-        self.assertEqual(options['eigenmode_setup']['max_delta_f'], '0.5')
-        self.assertEqual(options['eigenmode_setup']['max_passes'], '10')
-        self.assertEqual(options['eigenmode_setup']['min_passes'], '1')
-        self.assertEqual(options['eigenmode_setup']['min_converged'], '1')
-        self.assertEqual(options['eigenmode_setup']['pct_refinement'], '30')
-        self.assertEqual(options['eigenmode_setup']['basis_order'], '-1')
+        self.assertDictEqual(
+            options, {
+                'drivenmodal_setup': {
+                    'freq_ghz': '5',
+                    'name': 'Setup',
+                    'max_delta_s': '0.1',
+                    'max_passes': '10',
+                    'min_passes': '1',
+                    'min_converged': '1',
+                    'pct_refinement': '30',
+                    'basis_order': '1'
+                },
+                'eigenmode_setup': {
+                    'name': 'Setup',
+                    'min_freq_ghz': '1',
+                    'n_modes': '1',
+                    'max_delta_f': '0.5',
+                    'max_passes': '10',
+                    'min_passes': '1',
+                    'min_converged': '1',
+                    'pct_refinement': '30',
+                    'basis_order': '2'
+                },
+                'port_inductor_gap': '10um'
+            })
+
+        options['eigenmode_setup']['n_modes'] = '3'
+        self.assertEqual(
+            QHFSSRenderer.hfss_options['eigenmode_setup']['n_modes'], '1')
 
     def test_renderer_gdsrenderer_options(self):
         """Test that default_options in QGDSRenderer were not accidentally
@@ -384,6 +395,46 @@ class TestRenderers(unittest.TestCase):
         result = renderer._get_chip_names()
         self.assertEqual(result, {'main': {}})
 
+    def test_renderer_hfss_render_key(self):
+        """Test _render_key in hfss_renderer.py."""
+        design = designs.DesignPlanar()
+        TransmonPocket(design, 'Q1')
+        renderer = QHFSSRenderer(design, initiate=False)
+        renderer.qcomp_ids, renderer.case = renderer.get_unique_component_ids(
+            None)
+
+        key = renderer._render_key([], None, None, None, True)
+        self.assertEqual(key, renderer._render_key([], None, None, None, True))
+        no_buffer_key = renderer._render_key([], None, None, None, False)
+        self.assertNotEqual(key, no_buffer_key)
+
+        design.components['Q1'].options.pad_gap = '50um'
+        design.rebuild()
+        rebuilt_key = renderer._render_key([], None, None, None, True)
+        self.assertNotEqual(key, rebuilt_key)
+
+    def test_renderer_hfss_convergence_cache(self):
+        """Test the convergence cache of get_convergences in
+        hfss_renderer.py."""
+        design = designs.DesignPlanar()
+        renderer = QHFSSRenderer(design, initiate=False)
+        renderer._pinfo = MagicMock()
+        renderer.pinfo.setup.name = 'Setup'
+        get_convergence = renderer.pinfo.setup.get_convergence
+        get_convergence.return_value = (None, 'Converged: Yes')
+
+        with patch.object(hfss_renderer, 'hfss_report_f_convergence'):
+            renderer.get_convergences()
+            renderer.get_convergences(use_cache=True)
+            self.assertEqual(get_convergence.call_count, 1)
+
+            renderer.get_convergences()
+            self.assertEqual(get_convergence.call_count, 2)
+
+            renderer.analyze_sweep('Sweep', 'Setup')
+            renderer.get_convergences(use_cache=True)
+            self.assertEqual(get_convergence.call_count, 3)
+
     def test_renderer_setup_renderers(self):
         """Test setup_renderers in setup_defauts.py."""
         actual = setup_default.setup_renderers()